@@ -28,23 +28,42 @@ Align2Custom module implementation
 """
 
 
+import functools
 import math
 import mathutils as mu
-import threading as thd
 import time
 import bpy
 
 
 # ## Global data ##############################################################
 GL_ADDON_KEYMAPS = []       # Keymap collection
-GL_TOKEN_LOCK = False       # Locking token while rotating 3D View
+GL_SMOOTH_ROTATIONS = {}    # Smooth rotations in progress, by 3D View
+
+# Keyboard shortcuts (ALT + key) : (key, CTRL modifier, viewpoint, align mode)
+GL_KEYMAP_ITEMS = (
+    # Shortcuts for align to custom orientation operators
+    ('NUMPAD_7', False, 'TOP', 'CUSTOM'),
+    ('NUMPAD_7', True, 'BOTTOM', 'CUSTOM'),
+    ('NUMPAD_1', False, 'FRONT', 'CUSTOM'),
+    ('NUMPAD_1', True, 'BACK', 'CUSTOM'),
+    ('NUMPAD_3', False, 'RIGHT', 'CUSTOM'),
+    ('NUMPAD_3', True, 'LEFT', 'CUSTOM'),
+
+    # Shortcuts for align to 3D cursor operators
+    ('NUMPAD_8', False, 'TOP', 'CURSOR'),
+    ('NUMPAD_8', True, 'BOTTOM', 'CURSOR'),
+    ('NUMPAD_5', False, 'FRONT', 'CURSOR'),
+    ('NUMPAD_5', True, 'BACK', 'CURSOR'),
+    ('NUMPAD_6', False, 'RIGHT', 'CURSOR'),
+    ('NUMPAD_6', True, 'LEFT', 'CURSOR'),
+)
 
 
 # ## Math functions section ###################################################
 def s_curve(x):
     """
     Function that returns the transformation of a linear value by a s-curve
-    function.
+    function (smoothstep polynomial 3x^2 - 2x^3).
 
     Parameter :
      - x [in] : float value [0.0, 1.0]
@@ -55,7 +74,87 @@ def s_curve(x):
     assert (0.0 <= x <= 1.0), ("Overflow error : argument 'x' should "
                                "be in the range [0, 1]")
 
-    return (1.0 + math.sin((x - 0.5) * math.pi))/2.0
+    return x * x * (3.0 - 2.0 * x)
+
+
+@functools.lru_cache(maxsize=None)
+def s_curve_range(nb_samples):
+    """
+    Function that returns 'nb_samples' values of the s-curve function,
+    regularly sampled over the range ]0.0, 1.0]. The value for 0.0 is left
+    out since it always matches the starting point. Results are cached, since
+    only a few sample counts are ever requested.
+
+    Parameter :
+     - nb_samples [in] : int value > 0
+
+    Return value : tuple of float values
+    """
+
+    assert (nb_samples > 0), ("Value error : argument 'nb_samples' should "
+                              "be strictly positive")
+
+    step = 1.0 / nb_samples
+    return tuple(s_curve(i * step) for i in range(1, nb_samples + 1))
+
+
+# Coefficients of the polynomial approximation of the SLERP weights, from
+# "A Fast and Accurate Algorithm for Computing SLERP" (David Eberly, 2011)
+SLERP_MU = 1.85298109240830
+SLERP_U = tuple(1.0 / ((i + 1) * (2 * i + 3)) for i in range(7)) + \
+          (SLERP_MU / (8 * 17),)
+SLERP_V = tuple((i + 1) / (2 * i + 3) for i in range(7)) + \
+          (SLERP_MU * 8 / 17,)
+
+
+def fast_slerp(quat_begin, quat_end, t):
+    """
+    Function that returns the spherical linear interpolation between two unit
+    quaternions, without any trigonometric function call. The quaternions are
+    expected to be in the same hemisphere (positive dot product), so that the
+    interpolation takes the shortest path.
+
+    Parameters :
+     - quat_begin [in] : mathutils.Quaternion, orientation for t = 0.0
+     - quat_end [in] : mathutils.Quaternion, orientation for t = 1.0
+     - t [in] : float value [0.0, 1.0]
+
+    Return value : mathutils.Quaternion
+    """
+
+    xm1 = quat_begin.dot(quat_end) - 1.0
+    d = 1.0 - t
+    sqr_t = t * t
+    sqr_d = d * d
+
+    weight_begin = 1.0
+    weight_end = 1.0
+    for u, v in zip(reversed(SLERP_U), reversed(SLERP_V)):
+        weight_begin = 1.0 + (u * sqr_d - v) * xm1 * weight_begin
+        weight_end = 1.0 + (u * sqr_t - v) * xm1 * weight_end
+
+    return quat_begin * (d * weight_begin) + quat_end * (t * weight_end)
+
+
+def nlerp(quat_begin, quat_end, t):
+    """
+    Function that returns the normalized linear interpolation between two unit
+    quaternions. It is cheaper than a SLERP, and visually equivalent for small
+    rotations. The quaternions are expected to be in the same hemisphere
+    (positive dot product), so that the interpolation takes the shortest path.
+
+    Parameters :
+     - quat_begin [in] : mathutils.Quaternion, orientation for t = 0.0
+     - quat_end [in] : mathutils.Quaternion, orientation for t = 1.0
+     - t [in] : float value [0.0, 1.0]
+
+    Return value : mathutils.Quaternion
+    """
+
+    quat = quat_begin * (1.0 - t) + quat_end * t
+    quat.normalize()
+
+    return quat
 
 
 # ## Preferences section ######################################################
@@ -85,19 +184,19 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
     bl_label = "Align to 3D cursor or custom transform orientation"
     bl_options = {'REGISTER', 'UNDO'}
 
-    ALIGN_MODE_ITEMS = [
+    ALIGN_MODE_ITEMS = (
         ("CUSTOM", "Align to custom orientation", "", 1),
         ("CURSOR", "Align to cursor orientation", "", 2),
-    ]
+    )
 
-    VIEWPOINT_ITEMS = [
+    VIEWPOINT_ITEMS = (
         ("TOP", "Top view", "", 1),
         ("BOTTOM", "Bottom view", "", 2),
         ("FRONT", "Front view", "", 3),
         ("BACK", "Back view", "", 4),
         ("RIGHT", "Right view", "", 5),
         ("LEFT", "Left view", "", 6),
-    ]
+    )
 
     prop_align_mode: bpy.props.EnumProperty(items=ALIGN_MODE_ITEMS,
                                             name="Align mode",
@@ -106,105 +205,165 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
                                            name="Point of view",
                                            default="TOP")
 
+    # Rotation of each viewpoint relatively to the reference orientation.
+    # Quaternions are frozen since they are shared by every call.
+    VIEWPOINT_ROTATIONS = {
+        "TOP": mu.Quaternion().freeze(),
+        "BOTTOM": mu.Quaternion((1.0, 0.0, 0.0), math.pi).freeze(),
+        "FRONT": mu.Quaternion((1.0, 0.0, 0.0), math.pi / 2.0).freeze(),
+        "BACK": (mu.Quaternion((1.0, 0.0, 0.0), math.pi / 2.0)
+                 @ mu.Quaternion((0.0, 1.0, 0.0), math.pi)).freeze(),
+        "RIGHT": (mu.Quaternion((1.0, 0.0, 0.0), math.pi / 2.0)
+                  @ mu.Quaternion((0.0, 1.0, 0.0), math.pi / 2.0)).freeze(),
+        "LEFT": (mu.Quaternion((1.0, 0.0, 0.0), math.pi / 2.0)
+                 @ mu.Quaternion((0.0, 1.0, 0.0), -math.pi / 2.0)).freeze(),
+    }
+
     SMOOTH_ROT_STEP = 0.02
     SMOOTH_ROT_DURATION = 0.24
-
-    @staticmethod
-    def smooth_rotate(space, quat_begin, quat_end):
-        """
-        Rotate the 3D view smoothly between the quaternions 'quat_begin' and
-        'quat_end'
-        """
-
-        global GL_TOKEN_LOCK
-
-        if space:
-            # Calculation of the rotation angle which is used to compute the
-            # smooth rotation duration
-            diff_quat = quat_end.rotation_difference(quat_begin)
-            _, angle = diff_quat.to_axis_angle()
-            duration = abs(VIEW3D_OT_a2c.SMOOTH_ROT_DURATION * angle / math.pi)
-
-            start_time = time.time()
-            current_time = start_time
-
-            while current_time <= start_time + duration:
-                if duration == 0.0:
-                    factor = 1.0
-                else:
-                    factor = s_curve((current_time - start_time) / duration)
-                orientation = quat_begin.slerp(quat_end, factor)
-                space.region_3d.view_rotation = orientation
-
-                time.sleep(VIEW3D_OT_a2c.SMOOTH_ROT_STEP)
-                current_time = time.time()
-
-            space.region_3d.view_rotation = quat_end
-
-        GL_TOKEN_LOCK = False
+    SMOOTH_ROT_MIN_ANGLE = 1e-4
+    SMOOTH_ROT_NLERP_FRAMES = 3
 
     def execute(self, context):
         """
         Set the orientation of the 3D View in which the operator is called,
-        as a combination of the 3D cursor matrix or the active custom transform
-        orientation matrix, and the rotation matrix passed in argument.
+        as a combination of the 3D cursor orientation or the active custom
+        transform orientation, and the rotation of the selected viewpoint.
 
         The rotation transition depends on the parameter selected in the addon
-        preferences UI. The transition can be instantaneous or smooth.
+        preferences UI. The transition can be instantaneous or smooth. A smooth
+        transition turns the operator into a modal one, driven by a window
+        timer.
         """
 
-        global GL_TOKEN_LOCK
-
-        # Get the addon preferences
-        prefs = context.preferences.addons[__package__].preferences
-
         scene = context.window.scene
         space = context.space_data
 
         co = scene.transform_orientation_slots[0].custom_orientation
-        if (not GL_TOKEN_LOCK) and \
-           (space.type == 'VIEW_3D') and \
+        if (space.type == 'VIEW_3D') and \
            ((self.prop_align_mode == 'CURSOR') or co):
 
-            # Compute the rotation matrix according to the desired viewpoint
-            if self.prop_viewpoint == "BOTTOM":
-                rot_matrix = mu.Matrix.Rotation(math.radians(180.0), 3, 'X')
-            elif self.prop_viewpoint == "FRONT":
-                rot_matrix = mu.Matrix.Rotation(math.radians(90.0), 3, 'X')
-            elif self.prop_viewpoint == "BACK":
-                rot_matrix = mu.Matrix.Rotation(math.radians(90.0), 3, 'X')\
-                           @ mu.Matrix.Rotation(math.radians(180.0), 3, 'Y')
-            elif self.prop_viewpoint == "RIGHT":
-                rot_matrix = mu.Matrix.Rotation(math.radians(90.0), 3, 'X')\
-                           @ mu.Matrix.Rotation(math.radians(90.0), 3, 'Y')
-            elif self.prop_viewpoint == "LEFT":
-                rot_matrix = mu.Matrix.Rotation(math.radians(90.0), 3, 'X')\
-                           @ mu.Matrix.Rotation(math.radians(-90.0), 3, 'Y')
-            else:   # TOP (DEFAULT)
-                rot_matrix = mu.Matrix.Identity(3)
-
+            # Combine the reference orientation with the rotation of the
+            # desired viewpoint
             if self.prop_align_mode == 'CURSOR':
-                new_orientation = scene.cursor.matrix.to_3x3() @ rot_matrix
+                ref_quat = scene.cursor.matrix.to_quaternion()
             else:
-                new_orientation = co.matrix @ rot_matrix
+                ref_quat = co.matrix.to_quaternion()
 
-            final_quat = new_orientation.to_quaternion()
+            final_quat = ref_quat @ \
+                VIEW3D_OT_a2c.VIEWPOINT_ROTATIONS[self.prop_viewpoint]
 
             space.region_3d.view_perspective = 'ORTHO'
 
-            if prefs.pref_smooth:
-                initial_quat = space.region_3d.view_rotation
-                rotation_job = thd.Thread(
-                                    target=VIEW3D_OT_a2c.smooth_rotate,
-                                    args=(space, initial_quat, final_quat))
+            initial_quat = space.region_3d.view_rotation.copy()
 
-                GL_TOKEN_LOCK = True
-                rotation_job.start()
-            else:
-                space.region_3d.view_rotation = final_quat
+            # Calculation of the rotation angle which is used to compute the
+            # smooth rotation duration. The absolute value of the dot product
+            # gives the angle of the shortest rotation.
+            dot = abs(initial_quat.dot(final_quat))
+            angle = 2.0 * math.acos(min(1.0, dot))
+
+            # A smooth rotation already in progress in this 3D View is
+            # redirected toward the new orientation, rather than ignoring the
+            # new request until it is over
+            rotation = GL_SMOOTH_ROTATIONS.get(space.as_pointer())
+            if rotation is not None:
+                rotation.set_keyframes(initial_quat, final_quat, angle)
+                return {'FINISHED'}
+
+            # The addon preferences are looked up only when they are needed,
+            # but not cached : Blender recreates them when the preferences are
+            # reverted or reset to factory settings. A negligible rotation is
+            # never smoothed.
+            prefs = context.preferences.addons[__package__].preferences
+            if prefs.pref_smooth and \
+               (angle >= VIEW3D_OT_a2c.SMOOTH_ROT_MIN_ANGLE):
+                self.set_keyframes(initial_quat, final_quat, angle)
+                # The 3D region is looked up once, not on each step
+                self._space_key = space.as_pointer()
+                self._region_3d = space.region_3d
+                self._quat_begin = initial_quat
+
+                wm = context.window_manager
+                self._timer = wm.event_timer_add(
+                                    VIEW3D_OT_a2c.SMOOTH_ROT_STEP,
+                                    window=context.window)
+                wm.modal_handler_add(self)
+                GL_SMOOTH_ROTATIONS[self._space_key] = self
+
+                return {'RUNNING_MODAL'}
+
+            space.region_3d.view_rotation = final_quat
 
         return {'FINISHED'}
 
+    def set_keyframes(self, quat_begin, quat_end, angle):
+        """
+        (Re)start the smooth rotation from 'quat_begin' to 'quat_end', whose
+        duration depends on the rotation 'angle'.
+
+        Intermediate orientations are computed once, so that each step of the
+        rotation only has to apply the next one. Rotations short enough to
+        take at most SMOOTH_ROT_NLERP_FRAMES frames (45 degrees) are
+        interpolated linearly, which is indistinguishable from a SLERP at
+        that scale.
+        """
+
+        duration = VIEW3D_OT_a2c.SMOOTH_ROT_DURATION * angle / math.pi
+        nb_frames = max(1, math.ceil(duration / VIEW3D_OT_a2c.SMOOTH_ROT_STEP))
+
+        if nb_frames <= VIEW3D_OT_a2c.SMOOTH_ROT_NLERP_FRAMES:
+            interpolate = nlerp
+        else:
+            interpolate = fast_slerp
+
+        # Both quaternions are put in the same hemisphere once for all the
+        # keyframes, so that the interpolation takes the shortest path
+        if quat_begin.dot(quat_end) < 0.0:
+            quat_end = -quat_end
+
+        factors = s_curve_range(nb_frames)
+        self._keyframes = [interpolate(quat_begin, quat_end, f)
+                           for f in factors[:-1]] + [quat_end]
+        self._start_time = time.perf_counter()
+
+    def modal(self, context, event):
+        """
+        Rotate the 3D view one step further on each timer event until the end
+        of the smooth rotation. ESC or right click cancels the rotation and
+        restores the initial orientation of the 3D view.
+        """
+
+        if event.type in {'ESC', 'RIGHTMOUSE'}:
+            self._region_3d.view_rotation = self._quat_begin
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # The keyframe is picked from the elapsed time, so that late timer
+        # events don't slow down the rotation. Keyframe i is due after
+        # (i + 1) steps.
+        last_index = len(self._keyframes) - 1
+        elapsed_time = time.perf_counter() - self._start_time
+        index = int(elapsed_time / VIEW3D_OT_a2c.SMOOTH_ROT_STEP) - 1
+        index = max(0, min(last_index, index))
+        self._region_3d.view_rotation = self._keyframes[index]
+
+        # Timer events are passed through, since they may belong to another
+        # timer of the window, e.g. a smooth rotation in another 3D View
+        if index < last_index:
+            return {'PASS_THROUGH'}
+
+        self.cancel(context)
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        """ Release the timer and the 3D view of the smooth rotation """
+        context.window_manager.event_timer_remove(self._timer)
+        GL_SMOOTH_ROTATIONS.pop(self._space_key, None)
+
 
 # ## Menus section ############################################################
 class VIEW3D_MT_a2c(bpy.types.Menu):
@@ -215,42 +374,33 @@ class VIEW3D_MT_a2c(bpy.types.Menu):
     bl_idname = "VIEW3D_MT_a2c"
     bl_label = "Align View base class"
 
+    # Menu items : (label, viewpoint), or None for a separator
+    MENU_ITEMS = (
+        ("Top", 'TOP'),
+        ("Bottom", 'BOTTOM'),
+        None,
+        ("Front", 'FRONT'),
+        ("Back", 'BACK'),
+        None,
+        ("Right", 'RIGHT'),
+        ("Left", 'LEFT'),
+    )
+
     def draw(self, context):
         """ Display menu items """
         self.create_items(context)
 
     def create_items(self, context, align_mode='CUSTOM'):
         """ Create menu items """
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Top")
-        operator_prop.prop_viewpoint = 'TOP'
-        operator_prop.prop_align_mode = align_mode
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Bottom")
-        operator_prop.prop_viewpoint = 'BOTTOM'
-        operator_prop.prop_align_mode = align_mode
-
-        self.layout.separator()
-
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Front")
-        operator_prop.prop_viewpoint = 'FRONT'
-        operator_prop.prop_align_mode = align_mode
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Back")
-        operator_prop.prop_viewpoint = 'BACK'
-        operator_prop.prop_align_mode = align_mode
-
-        self.layout.separator()
-
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Right")
-        operator_prop.prop_viewpoint = 'RIGHT'
-        operator_prop.prop_align_mode = align_mode
-        operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
-                                             text="Left")
-        operator_prop.prop_viewpoint = 'LEFT'
-        operator_prop.prop_align_mode = align_mode
+        for item in VIEW3D_MT_a2c.MENU_ITEMS:
+            if item is None:
+                self.layout.separator()
+            else:
+                label, viewpoint = item
+                operator_prop = self.layout.operator(VIEW3D_OT_a2c.bl_idname,
+                                                     text=label)
+                operator_prop.prop_viewpoint = viewpoint
+                operator_prop.prop_align_mode = align_mode
 
 
 class VIEW3D_MT_align2custom(VIEW3D_MT_a2c):
@@ -295,17 +445,55 @@ def a2c_menu_func(self, context):
 
 
 # ## Blender registration section #############################################
+# Classes of the addon, in registration order
+GL_CLASSES = (
+    A2C_Preferences,
+    VIEW3D_OT_a2c,
+    VIEW3D_MT_a2c,
+    VIEW3D_MT_align2custom,
+    VIEW3D_MT_align2cursor,
+)
+
+register_classes, unregister_classes = \
+    bpy.utils.register_classes_factory(GL_CLASSES)
+
+
+def set_km_item(km, key, ctrl, viewpoint, align_mode):
+    """
+    Add to the keymap 'km' a shortcut ALT + 'key' (+ CTRL if 'ctrl' is True)
+    which calls the alignment operator with the given viewpoint and mode
+    """
+    global GL_ADDON_KEYMAPS
+
+    if km:
+        # An identical shortcut may remain from a previous registration which
+        # was not fully cleaned : it is reused rather than duplicated
+        for kmi in km.keymap_items:
+            if (kmi.idname, kmi.type, kmi.ctrl, kmi.alt) == \
+               (VIEW3D_OT_a2c.bl_idname, key, ctrl, True) and \
+               (kmi.properties.prop_viewpoint == viewpoint) and \
+               (kmi.properties.prop_align_mode == align_mode):
+                break
+        else:
+            kmi = km.keymap_items.new(VIEW3D_OT_a2c.bl_idname,
+                                      key, 'PRESS',
+                                      alt=True, ctrl=ctrl)
+            kmi.properties.prop_viewpoint = viewpoint
+            kmi.properties.prop_align_mode = align_mode
+
+        # A reused shortcut may still be tracked if the previous unregister
+        # failed before clearing the collection
+        if (km, kmi) not in GL_ADDON_KEYMAPS:
+            GL_ADDON_KEYMAPS.append((km, kmi))
+
+
 def register():
     """
     Module register function called by the main package register function
     """
     global GL_ADDON_KEYMAPS
 
-    bpy.utils.register_class(A2C_Preferences)
-    bpy.utils.register_class(VIEW3D_OT_a2c)
-    bpy.utils.register_class(VIEW3D_MT_a2c)
-    bpy.utils.register_class(VIEW3D_MT_align2custom)
-    bpy.utils.register_class(VIEW3D_MT_align2cursor)
+    register_classes()
 
     bpy.types.VIEW3D_MT_view_align.append(a2c_menu_func)
 
@@ -314,32 +502,8 @@ def register():
             name='3D View',
             space_type='VIEW_3D')
 
-        def set_km_item(km, key, ctrl, viewpoint, align_mode):
-            global GL_ADDON_KEYMAPS
-
-            if km:
-                kmi = km.keymap_items.new(VIEW3D_OT_a2c.bl_idname,
-                                          key, 'PRESS',
-                                          alt=True, ctrl=ctrl)
-                kmi.properties.prop_viewpoint = viewpoint
-                kmi.properties.prop_align_mode = align_mode
-                GL_ADDON_KEYMAPS.append((km, kmi))
-
-        # Shortcuts for align to custom orientation operators
-        set_km_item(km, 'NUMPAD_7', False, 'TOP', 'CUSTOM')
-        set_km_item(km, 'NUMPAD_7', True, 'BOTTOM', 'CUSTOM')
-        set_km_item(km, 'NUMPAD_1', False, 'FRONT', 'CUSTOM')
-        set_km_item(km, 'NUMPAD_1', True, 'BACK', 'CUSTOM')
-        set_km_item(km, 'NUMPAD_3', False, 'RIGHT', 'CUSTOM')
-        set_km_item(km, 'NUMPAD_3', True, 'LEFT', 'CUSTOM')
-
-        # Shortcuts for align to 3D cursor operators
-        set_km_item(km, 'NUMPAD_8', False, 'TOP', 'CURSOR')
-        set_km_item(km, 'NUMPAD_8', True, 'BOTTOM', 'CURSOR')
-        set_km_item(km, 'NUMPAD_5', False, 'FRONT', 'CURSOR')
-        set_km_item(km, 'NUMPAD_5', True, 'BACK', 'CURSOR')
-        set_km_item(km, 'NUMPAD_6', False, 'RIGHT', 'CURSOR')
-        set_km_item(km, 'NUMPAD_6', True, 'LEFT', 'CURSOR')
+        for key, ctrl, viewpoint, align_mode in GL_KEYMAP_ITEMS:
+            set_km_item(km, key, ctrl, viewpoint, align_mode)
 
 
 def unregister():
@@ -348,17 +512,27 @@ def unregister():
     """
     global GL_ADDON_KEYMAPS
 
+    # Blender frees the modal handlers of an unregistered operator without
+    # calling its cancel() method : the timers of the rotations in progress
+    # are removed here, and the rotations forgotten so that they aren't
+    # redirected once the addon is registered again
+    for rotation in GL_SMOOTH_ROTATIONS.values():
+        bpy.context.window_manager.event_timer_remove(rotation._timer)
+    GL_SMOOTH_ROTATIONS.clear()
+
+    # Shortcuts are removed one at a time, so that a stale one doesn't prevent
+    # the others from being removed and the collection from being cleared
     for km, kmi in GL_ADDON_KEYMAPS:
-        km.keymap_items.remove(kmi)
+        try:
+            km.keymap_items.remove(kmi)
+        except (ReferenceError, RuntimeError):
+            pass
     GL_ADDON_KEYMAPS.clear()
 
     bpy.types.VIEW3D_MT_view_align.remove(a2c_menu_func)
 
-    bpy.utils.unregister_class(VIEW3D_MT_align2cursor)
-    bpy.utils.unregister_class(VIEW3D_MT_align2custom)
-    bpy.utils.unregister_class(VIEW3D_MT_a2c)
-    bpy.utils.unregister_class(VIEW3D_OT_a2c)
-    bpy.utils.unregister_class(A2C_Preferences)
+    # Classes are unregistered in reverse order
+    unregister_classes()
 
 
 # ## MAIN test section ########################################################